@@ -22,7 +22,8 @@ from . import graph_manager
 from . import graph_view
 from . import graph_viewmodel
 from . import logger_factory
-from . import ros2networkx
+# ros2networkx is imported on demand by GraphManager;
+# importing it here would load the ROS client stack at startup
 from .dear_ros_node_viewer import main
 
 try:
@@ -17,8 +17,12 @@ Function to create NetworkX object from CARET architecture.yaml
 
 from __future__ import annotations
 import networkx as nx
-import matplotlib.pyplot as plt
 import yaml
+try:
+  # libyaml-backed loader is much faster than the pure Python one
+  from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+  from yaml import SafeLoader as YamlSafeLoader
 from .logger_factory import LoggerFactory
 
 logger = LoggerFactory.create(__name__)
@@ -48,20 +52,10 @@ def parse_all_graph(yml, node_name_list, topic_pub_dict, topic_sub_dict):
   for node in nodes:
     node_name = quote_name(node['node_name'])
     node_name_list.append(node_name)
-    if 'publishes' in node:
-      publishes = node['publishes']
-      for publish in publishes:
-        if publish['topic_name'] in topic_pub_dict:
-          topic_pub_dict[publish['topic_name']].append(node_name)
-        else:
-          topic_pub_dict[publish['topic_name']] = [node_name]
-    if 'subscribes' in node:
-      subscribes = node['subscribes']
-      for subscribe in subscribes:
-        if subscribe['topic_name'] in topic_sub_dict:
-          topic_sub_dict[subscribe['topic_name']].append(node_name)
-        else:
-          topic_sub_dict[subscribe['topic_name']] = [node_name]
+    for publish in node.get('publishes', []):
+      topic_pub_dict.setdefault(publish['topic_name'], []).append(node_name)
+    for subscribe in node.get('subscribes', []):
+      topic_sub_dict.setdefault(subscribe['topic_name'], []).append(node_name)
 
 
 def parse_target_path(yml, node_name_list, topic_pub_dict, topic_sub_dict):
@@ -100,7 +94,7 @@ def make_graph_from_topic_association(topic_pub_dict: dict[str, list[str]],
 
 
 def caret2networkx(filename: str, target_path: str = 'all_graph',
-           ignore_unconnected=True) -> nx.classes.multidigraph.MultiDiGraph:
+           ignore_unconnected=True, yml=None) -> nx.classes.multidigraph.MultiDiGraph:
   """
   Create NetworkX Graph from architecture.yaml generated by CARET
 
@@ -112,6 +106,8 @@ def caret2networkx(filename: str, target_path: str = 'all_graph',
     'all_graph': create a graph including all node and path
     'all_targets': create a graph including all paths in named_paths
     path name: create a graph including path name in named_paths
+  yml : dict, default None
+    already parsed architecture file. When set, filename is not read again
 
   Returns
   -------
@@ -127,12 +123,13 @@ def caret2networkx(filename: str, target_path: str = 'all_graph',
   # "/topic_0": ["/node_1", ], <- subscribers of /topic_0 are ["/node_1", ] #
   topic_sub_dict: dict[str, list[str]] = {}
 
-  with open(filename, encoding='UTF-8') as file:
-    yml = yaml.safe_load(file)
-    if target_path == 'all_graph':
-      parse_all_graph(yml, node_name_list, topic_pub_dict, topic_sub_dict)
-    else:
-      parse_target_path(yml, node_name_list, topic_pub_dict, topic_sub_dict)
+  if yml is None:
+    with open(filename, encoding='UTF-8') as file:
+      yml = yaml.load(file, Loader=YamlSafeLoader)
+  if target_path == 'all_graph':
+    parse_all_graph(yml, node_name_list, topic_pub_dict, topic_sub_dict)
+  else:
+    parse_target_path(yml, node_name_list, topic_pub_dict, topic_sub_dict)
 
   graph = make_graph_from_topic_association(topic_pub_dict, topic_sub_dict)
 
@@ -148,6 +145,7 @@ def caret2networkx(filename: str, target_path: str = 'all_graph',
 if __name__ == '__main__':
   def local_main():
     """main function for this file"""
+    import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
     graph = caret2networkx('architecture.yaml')
     pos = nx.spring_layout(graph)
     # pos = nx.circular_layout(graph)
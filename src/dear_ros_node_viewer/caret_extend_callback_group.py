@@ -19,7 +19,7 @@ from __future__ import annotations
 import random
 import networkx as nx
 import yaml
-from .caret2networkx import quote_name
+from .caret2networkx import quote_name, YamlSafeLoader
 from .logger_factory import LoggerFactory
 
 logger = LoggerFactory.create(__name__)
@@ -166,14 +166,16 @@ def create_dict_node_callbackgroup(yml):
 
 
 def extend_callback_group(filename: str,
-              graph: nx.classes.digraph.DiGraph) -> nx.classes.digraph.DiGraph:
+              graph: nx.classes.digraph.DiGraph,
+              yml=None) -> nx.classes.digraph.DiGraph:
   """Add callback group info to a graph"""
-  with open(filename, encoding='UTF-8') as file:
-    yml = yaml.safe_load(file)
-    dict_node_cbgroup = create_dict_node_callbackgroup(yml)
-    # import json
-    # with open('caret_executor.json', encoding='UTF-8', mode='w') as f_caret_executor:
-    #     json.dump(dict_node_cbgroup, f_caret_executor, ensure_ascii=True, indent=4)
+  if yml is None:
+    with open(filename, encoding='UTF-8') as file:
+      yml = yaml.load(file, Loader=YamlSafeLoader)
+  dict_node_cbgroup = create_dict_node_callbackgroup(yml)
+  # import json
+  # with open('caret_executor.json', encoding='UTF-8', mode='w') as f_caret_executor:
+  #     json.dump(dict_node_cbgroup, f_caret_executor, ensure_ascii=True, indent=4)
   for node_name in graph.nodes:
     graph.nodes[node_name]['callback_group_list'] = dict_node_cbgroup[node_name]
   return graph
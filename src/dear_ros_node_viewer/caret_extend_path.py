@@ -16,21 +16,22 @@ Function for additional information from CARET
 """
 from __future__ import annotations
 import yaml
-from .caret2networkx import quote_name
+from .caret2networkx import quote_name, YamlSafeLoader
 
 
-def get_path_dict(filename: str) -> dict:
+def get_path_dict(filename: str, yml=None) -> dict:
   """Get target path information"""
   path_dict = {}
-  with open(filename, encoding='UTF-8') as file:
-    yml = yaml.safe_load(file)
-    path_info_list = yml['named_paths']
-    for path_info in path_info_list:
-      path_name = path_info['path_name']
-      node_chain = path_info['node_chain']
-      node_name_list = []
-      for node in node_chain:
-        node_name_list.append(quote_name(node['node_name']))
-      path_dict[path_name] = node_name_list
+  if yml is None:
+    with open(filename, encoding='UTF-8') as file:
+      yml = yaml.load(file, Loader=YamlSafeLoader)
+  path_info_list = yml['named_paths']
+  for path_info in path_info_list:
+    path_name = path_info['path_name']
+    node_chain = path_info['node_chain']
+    node_name_list = []
+    for node in node_chain:
+      node_name_list.append(quote_name(node['node_name']))
+    path_dict[path_name] = node_name_list
 
   return path_dict
@@ -17,7 +17,6 @@ Function to create NetworkX object from dot graph file (rosgraph.dot)
 
 from __future__ import annotations
 import networkx as nx
-import matplotlib.pyplot as plt
 
 from .logger_factory import LoggerFactory
 from .caret2networkx import make_graph_from_topic_association
@@ -67,15 +66,9 @@ def dot2networkx_nodetopic(graph_org: nx.classes.digraph.DiGraph) -> nx.classes.
     dst_is_node = bool(dst['shape'] == 'ellipse')
 
     if src_is_node is True and dst_is_node is False:
-      if dst_name in topic_pub_dict:
-        topic_pub_dict[dst_name].append(src_name)
-      else:
-        topic_pub_dict[dst_name] = [src_name]
+      topic_pub_dict.setdefault(dst_name, []).append(src_name)
     elif src_is_node is False and dst_is_node is True:
-      if src_name in topic_sub_dict:
-        topic_sub_dict[src_name].append(dst_name)
-      else:
-        topic_sub_dict[src_name] = [dst_name]
+      topic_sub_dict.setdefault(src_name, []).append(dst_name)
 
   graph = make_graph_from_topic_association(topic_pub_dict, topic_sub_dict)
 
@@ -106,6 +99,7 @@ def dot2networkx(filename: str, ignore_unconnected=True) -> nx.classes.digraph.D
 if __name__ == '__main__':
   def local_main():
     """main function for this file"""
+    import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
     graph = dot2networkx('rosgraph_nodeonly.dot')
     pos = nx.spring_layout(graph)
     # pos = nx.circular_layout(graph)
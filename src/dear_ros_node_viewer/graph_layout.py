@@ -22,6 +22,15 @@ from .logger_factory import LoggerFactory
 logger = LoggerFactory.create(__name__)
 
 
+def _flip_layout_y(layout: dict) -> dict:
+  """Flip y of all positions in one vectorized operation (0.0 is top, 1.0 is bottom)"""
+  if not layout:
+    return layout
+  layout_np = np.array(list(layout.values()))
+  layout_np[:, 1] = 1.0 - layout_np[:, 1]
+  return dict(zip(layout.keys(), layout_np))
+
+
 def place_node_by_group(graph, group_setting):
   """
   Place all nodes
@@ -46,24 +55,31 @@ def place_node_by_group(graph, group_setting):
       mapping_list[node_name] = node_name
   graph = nx.relabel_nodes(graph, mapping_list)
 
+  # Classify nodes into groups in a single pass,
+  # instead of re-checking every node name for every group #
+  group_node_map: dict[str, list[str]] = {group_name: [] for group_name in group_setting}
+  for node_name in graph.nodes:
+    for group_name in group_node_map:
+      if group_name in node_name:
+        group_node_map[group_name].append(node_name)
+
   # Place nodes and add properties into graph #
   for group_name, graph_property in group_setting.items():
-    layout = place_node(graph, group_name)
+    group_node_list = group_node_map[group_name]
+    layout = _flip_layout_y(place_node(graph, group_name, node_list=group_node_list))
     direction = graph_property['direction']
     offset = graph_property['offset']
     color = graph_property['color']
 
-    for node_name in graph.nodes:
-      if group_name in node_name:
-        pos = layout[node_name]
-        pos[1] = 1 - pos[1]     # 0.0 is top, 1.0 is bottom
-        if direction == 'horizontal':
-          graph.nodes[node_name]['pos'] = \
-            [offset[0] + pos[1] * offset[2], offset[1] + pos[0] * offset[3]]
-        else:
-          graph.nodes[node_name]['pos'] = \
-            [offset[0] + pos[0] * offset[2], offset[1] + pos[1] * offset[3]]
-        graph.nodes[node_name]['color'] = color
+    for node_name in group_node_list:
+      pos = layout[node_name]
+      if direction == 'horizontal':
+        graph.nodes[node_name]['pos'] = \
+          [offset[0] + pos[1] * offset[2], offset[1] + pos[0] * offset[3]]
+      else:
+        graph.nodes[node_name]['pos'] = \
+          [offset[0] + pos[0] * offset[2], offset[1] + pos[1] * offset[3]]
+      graph.nodes[node_name]['color'] = color
 
   # Remove "__other__" #
   mapping_list_swap = {v: k for k, v in mapping_list.items()}
@@ -72,7 +88,8 @@ def place_node_by_group(graph, group_setting):
   return graph
 
 
-def place_node(graph: nx.classes.digraph.DiGraph, group_name: str, prog: str = 'dot'):
+def place_node(graph: nx.classes.digraph.DiGraph, group_name: str, prog: str = 'dot',
+         node_list: list[str] = None):
   """
   Place nodes belonging to group.
   Normalized position [x, y] is set to graph.nodes[node]['pos']
@@ -87,6 +104,9 @@ def place_node(graph: nx.classes.digraph.DiGraph, group_name: str, prog: str = '
     Name of the GraphViz command to use for layout.
     Options depend on GraphViz version but may include:
     'dot', 'twopi', 'fdp', 'sfdp', 'circo'
+  node_list: list[str]  (default: None)
+    Nodes already known to belong to the group.
+    When omitted, nodes are looked up by group_name.
 
   Returns
   -------
@@ -94,12 +114,13 @@ def place_node(graph: nx.classes.digraph.DiGraph, group_name: str, prog: str = '
     Dictionary of normalized positions keyed by node.
   """
 
+  if node_list is None:
+    node_list = [node_name for node_name in graph.nodes if group_name in node_name]
+  node_set = set(node_list)
   graph_modified = nx.MultiDiGraph()
-  for node_name in graph.nodes:
-    if group_name in node_name:
-      graph_modified.add_node(node_name)
+  graph_modified.add_nodes_from(node_list)
   for edge in graph.edges:
-    if group_name in edge[0] and group_name in edge[1]:
+    if edge[0] in node_set and edge[1] in node_set:
       graph_modified.add_edge(edge[0], edge[1])
   try:
     layout = nx.nx_pydot.pydot_layout(graph_modified, prog=prog)
@@ -127,18 +148,12 @@ def normalize_layout(layout: dict[str, tuple[int, int]]):
 
   if len(layout) == 0:
     return layout
-  for key, val in layout.items():
-    layout[key] = list(val)
-  layout_np = np.array(list(layout.values()))
+  layout_np = np.array(list(layout.values()), dtype=np.float64)
   layout_min, layout_max = layout_np.min(0), layout_np.max(0)
   norm_w = max((layout_max[0] - layout_min[0]), 1)
   norm_h = max((layout_max[1] - layout_min[1]), 1)
-  if norm_w == 0 or norm_h == 0:
-    return layout
-  for pos in layout.values():
-    pos[0] = (pos[0] - layout_min[0]) / norm_w
-    pos[1] = (pos[1] - layout_min[1]) / norm_h
-  return layout
+  layout_np = (layout_np - layout_min) / np.array([norm_w, norm_h])
+  return dict(zip(layout.keys(), layout_np.tolist()))
 
 
 def align_layout(graph):
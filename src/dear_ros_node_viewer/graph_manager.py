@@ -16,12 +16,12 @@ from __future__ import annotations
 import os
 import re
 import networkx as nx
+import yaml
 from .logger_factory import LoggerFactory
-from .caret2networkx import caret2networkx
+from .caret2networkx import caret2networkx, YamlSafeLoader
 from .caret_extend_callback_group import extend_callback_group
 from .caret_extend_path import get_path_dict
 from .dot2networkx import dot2networkx
-from .ros2networkx import Ros2Networkx
 from .graph_layout import place_node_by_group
 
 logger = LoggerFactory.create(__name__)
@@ -38,11 +38,15 @@ class GraphManager:
 
   def load_graph_from_caret(self, filename: str, target_path: str = 'all_graph'):
     """ load_graph_from_caret """
+    # Parse the architecture file once and share it,
+    # instead of re-reading it in every helper
+    with open(filename, encoding='UTF-8') as file:
+      yml = yaml.load(file, Loader=YamlSafeLoader)
     self.graph = caret2networkx(filename, target_path,
-                  self.app_setting['ignore_unconnected_nodes'])
-    self.graph = extend_callback_group(filename, self.graph)
+                  self.app_setting['ignore_unconnected_nodes'], yml=yml)
+    self.graph = extend_callback_group(filename, self.graph, yml=yml)
     self.load_graph_postprocess(filename)
-    self.caret_path_dict.update(get_path_dict(filename))
+    self.caret_path_dict.update(get_path_dict(filename, yml=yml))
 
   def load_graph_from_dot(self, filename: str):
     """ load_graph_from_dot """
@@ -51,6 +55,9 @@ class GraphManager:
 
   def load_graph_from_running_ros(self):
     """ load_graph_from_running_ros """
+    # Deferred import: pulling in ros2networkx loads the ROS client stack,
+    # which is only needed when polling a running ROS graph
+    from .ros2networkx import Ros2Networkx  # pylint: disable=import-outside-toplevel
     ros2networkx = Ros2Networkx(node_name='temp')
     ros2networkx.save_graph('./temp.dot')
     ros2networkx.shutdown()
@@ -72,15 +79,28 @@ class GraphManager:
       self.graph = place_node_by_group(self.graph, self.group_setting)
       # self.graph = align_layout(self.graph)
 
+  @staticmethod
+  def _compile_filter(pattern_list: list[str]):
+    """Make a fullmatch function for filter patterns (single alternation regex if possible)"""
+    if not pattern_list:
+      return None
+    try:
+      return re.compile('|'.join('(?:' + pattern + ')' for pattern in pattern_list)).fullmatch
+    except re.error:
+      # A pattern like '(?i)...' is valid on its own but not inside an alternation.
+      # Fall back to matching the patterns one by one
+      def fullmatch(name):
+        return any(re.fullmatch(pattern, name) for pattern in pattern_list)
+      return fullmatch
+
   def filter_node(self):
     """Remove nodes which match filter setting"""
     remove_node_list = []
-    for node_name in self.graph.nodes:
-      node_name_org = node_name.strip('"')
-      for pattern in self.app_setting['ignore_node_list']:
-        if re.fullmatch(pattern, node_name_org):
+    ignore_node_match = self._compile_filter(self.app_setting['ignore_node_list'])
+    if ignore_node_match:
+      for node_name in self.graph.nodes:
+        if ignore_node_match(node_name.strip('"')):
           remove_node_list.append(node_name)
-          break
     self.graph.remove_nodes_from(remove_node_list)
     logger.info('%s nodes are removed by filter', len(remove_node_list))
 
@@ -92,13 +112,12 @@ class GraphManager:
   def filter_topic(self):
     """Remove topics which match filter setting"""
     remove_edge_list = []
-    for edge in self.graph.edges:
-      topic_name = self.graph.edges[edge]['label']
-      topic_name = topic_name.strip('"')
-      for pattern in self.app_setting['ignore_topic_list']:
-        if re.fullmatch(pattern, topic_name):
+    ignore_topic_match = self._compile_filter(self.app_setting['ignore_topic_list'])
+    if ignore_topic_match:
+      for edge in self.graph.edges:
+        topic_name = self.graph.edges[edge]['label']
+        if ignore_topic_match(topic_name.strip('"')):
           remove_edge_list.append(edge)
-          break
     self.graph.remove_edges_from(remove_edge_list)
     logger.info('%s topics are removed by filter', len(remove_edge_list))
 
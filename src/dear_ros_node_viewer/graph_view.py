@@ -23,10 +23,10 @@ logger = LoggerFactory.create(__name__)
 
 class GraphView:
   """Class to display node graph"""
-  # Color definitions
-  COLOR_NODE_SELECTED = [0, 0, 64]
-  COLOR_NODE_BAR = [32, 32, 32]
-  COLOR_NODE_BACK = [64, 64, 64]
+  # Color definitions (tuples so the palette stays immutable)
+  COLOR_NODE_SELECTED = (0, 0, 64)
+  COLOR_NODE_BAR = (32, 32, 32)
+  COLOR_NODE_BACK = (64, 64, 64)
 
   def __init__(
       self,
@@ -36,11 +36,18 @@ class GraphView:
 
     self.app_setting: dict = app_setting
     self.graph_viewmodel = GraphViewModel(app_setting, group_setting)
-    self.font_size: int = 15
-    self.font_list: dict[int, int] = {}
+
+    # font status. Each size is loaded on demand by _get_font
+    self.font = {
+      'size': 15,           # current font size
+      'path': '',           # font file path
+      'list': {},           # {size: font_id}
+      'registry_id': -1,    # font registry id
+    }
     self.dpg_window_id: int = -1
     self.dpg_id_editor: int = -1
     self.dpg_id_caret_path: int = -1
+    self.dpg_id_file_dialog: int = -1
 
   def start(self, graph_filename: str, display_cb_detail: bool, window_width: int = 1920, window_height: int = 1080):
     """ Start Dear PyGui context """
@@ -67,7 +74,7 @@ class GraphView:
 
     # Update node position and font according to the default graph size and font size
     self._cb_wheel(0, 0)
-    self._cb_menu_font_size(None, self.font_size, None)
+    self._cb_menu_font_size(None, self.font['size'], None)
 
     dpg.set_viewport_resize_callback(self._cb_resize)
     dpg.show_viewport()
@@ -79,12 +86,15 @@ class GraphView:
     if self.dpg_id_editor != -1:
       dpg.delete_item(self.dpg_id_editor)
 
-    with dpg.window(tag=self.dpg_window_id):
-      with dpg.node_editor(
-          menubar=False, minimap=True,
-          minimap_location=dpg.mvNodeMiniMap_Location_BottomLeft) as self.dpg_id_editor:
-        self.add_node_in_dpg(display_cb_detail)
-        self.add_link_in_dpg()
+    # Hold the render mutex so the whole graph is built in one frame
+    # instead of rendering partially constructed nodes
+    with dpg.mutex():
+      with dpg.window(tag=self.dpg_window_id):
+        with dpg.node_editor(
+            menubar=False, minimap=True,
+            minimap_location=dpg.mvNodeMiniMap_Location_BottomLeft) as self.dpg_id_editor:
+          self.add_node_in_dpg(display_cb_detail)
+          self.add_link_in_dpg()
     self.graph_viewmodel.load_layout()
 
     # Add CARET path
@@ -95,6 +105,9 @@ class GraphView:
   def add_menu_in_dpg(self):
     """ Add menu bar """
     with dpg.menu_bar():
+      with dpg.menu(label="File"):
+        dpg.add_menu_item(label="Open...", callback=self._cb_menu_file_open)
+
       with dpg.menu(label="Layout"):
         dpg.add_menu_item(label="Reset", callback=self._cb_menu_layout_reset)
         dpg.add_menu_item(label="Save", callback=self._cb_menu_layout_save, shortcut='(s)')
@@ -104,7 +117,7 @@ class GraphView:
 
       with dpg.menu(label="Font"):
         dpg.add_slider_int(label="Font Size",
-                   default_value=self.font_size, min_value=8, max_value=40,
+                   default_value=self.font['size'], min_value=8, max_value=40,
                    callback=self._cb_menu_font_size)
 
       with dpg.menu(label="NodeName"):
@@ -126,12 +139,34 @@ class GraphView:
         dpg.add_menu_item(label="Load Current Gaph",
                   callback=self._cb_menu_graph_current)
 
+  @staticmethod
+  def _make_edge_label_dict(graph):
+    """
+    Collect pub/sub topic labels for all nodes in a single pass over edges,
+    instead of scanning all edges again for every node
+    """
+    edge_list_pub_dict: dict[str, list[str]] = {}
+    edge_list_sub_dict: dict[str, list[str]] = {}
+    for edge in graph.edges:
+      label = graph.edges[edge].get('label')
+      pub_label = label if label is not None else 'out'
+      pub_list = edge_list_pub_dict.setdefault(edge[0], [])
+      if pub_label not in pub_list:
+        pub_list.append(pub_label)
+      sub_label = label if label is not None else 'in'
+      sub_list = edge_list_sub_dict.setdefault(edge[1], [])
+      if sub_label not in sub_list:
+        sub_list.append(sub_label)
+    return edge_list_pub_dict, edge_list_sub_dict
+
   def add_node_in_dpg(self, display_cb_detail: bool):
     """ Add nodes and attributes """
     graph = self.graph_viewmodel.get_graph()
-    for node_name in graph.nodes:
+    edge_list_pub_dict, edge_list_sub_dict = self._make_edge_label_dict(graph)
+
+    for node_name, node_attr in graph.nodes(data=True):
       # Calculate position in window
-      pos = graph.nodes[node_name]['pos']
+      pos = node_attr['pos']
       pos = [
         pos[0] * self.graph_viewmodel.graph_size[0],
         pos[1] * self.graph_viewmodel.graph_size[1]]
@@ -146,9 +181,7 @@ class GraphView:
           with dpg.theme_component(dpg.mvNode):
             dpg.add_theme_color(
               dpg.mvNodeCol_TitleBar,
-              graph.nodes[node_name]['color']
-              if 'color' in graph.nodes[node_name]
-              else self.COLOR_NODE_BAR,
+              node_attr.get('color', self.COLOR_NODE_BAR),
               category=dpg.mvThemeCat_Nodes)
             dpg.add_theme_color(
               dpg.mvNodeCol_NodeBackgroundSelected,
@@ -168,28 +201,19 @@ class GraphView:
           dpg.bind_item_handler_registry(node_id, node_select_handler)
 
         # Add text for node I/O(topics)
-        self.add_node_attr_in_dpg(node_name, display_cb_detail)
+        self.add_node_attr_in_dpg(node_name, display_cb_detail,
+                      edge_list_pub_dict.get(node_name, []),
+                      edge_list_sub_dict.get(node_name, []))
+
+    # Hide callback groups by default. Done once here instead of per node
+    self.graph_viewmodel.display_callbackgroup(False)
 
     self.graph_viewmodel.update_nodename(GraphViewModel.OmitType.LAST)
     self.graph_viewmodel.update_edgename(GraphViewModel.OmitType.LAST)
 
-  def add_node_attr_in_dpg(self, node_name, display_cb_detail: bool):
+  def add_node_attr_in_dpg(self, node_name, display_cb_detail: bool,
+               edge_list_pub: list[str], edge_list_sub: list[str]):
     """ Add attributes in node """
-    graph = self.graph_viewmodel.get_graph()
-    edge_list_pub = []
-    edge_list_sub = []
-    for edge in graph.edges:
-      if edge[0] == node_name:
-        label = graph.edges[edge]['label'] if 'label' in graph.edges[edge] else 'out'
-        if label in edge_list_pub:
-          continue
-        edge_list_pub.append(label)
-      if edge[1] == node_name:
-        label = graph.edges[edge]['label'] if 'label' in graph.edges[edge] else 'in'
-        if label in edge_list_sub:
-          continue
-        edge_list_sub.append(label)
-
     for edge in edge_list_sub:
       with dpg.node_attribute(attribute_type=dpg.mvNode_Attr_Input) as attr_id:
         text_id = dpg.add_text(default_value=edge)
@@ -208,14 +232,12 @@ class GraphView:
 
     # Add text for executor/callbackgroups
     self.add_node_callbackgroup_in_dpg(node_name, display_cb_detail)
-    # Hide by default
-    self.graph_viewmodel.display_callbackgroup(False)
 
   def add_node_callbackgroup_in_dpg(self, node_name, display_cb_detail: bool):
     """ Add callback group information """
-    graph = self.graph_viewmodel.get_graph()
-    if 'callback_group_list' in graph.nodes[node_name]:
-      callback_group_list = graph.nodes[node_name]['callback_group_list']
+    node_attr = self.graph_viewmodel.get_graph().nodes[node_name]
+    if 'callback_group_list' in node_attr:
+      callback_group_list = node_attr['callback_group_list']
       for callback_group in callback_group_list:
         executor_name = callback_group['executor_name']
         callback_group_name = callback_group['callback_group_name']
@@ -241,9 +263,13 @@ class GraphView:
   def add_link_in_dpg(self):
     """ Add links between node I/O """
     graph = self.graph_viewmodel.get_graph()
+    # Look up each publisher's color once instead of per edge
+    node_color_dict = {node_name: color
+               for node_name, color in graph.nodes(data='color')
+               if color is not None}
     for edge in graph.edges:
-      if 'label' in graph.edges[edge]:
-        label = graph.edges[edge]['label']
+      label = graph.edges[edge].get('label')
+      if label is not None:
         edge_id = dpg.add_node_link(
           self.graph_viewmodel.get_dpg_nodeedge_id(edge[0], label),
           self.graph_viewmodel.get_dpg_nodeedge_id(edge[1], label))
@@ -258,7 +284,7 @@ class GraphView:
         with dpg.theme_component(dpg.mvNodeLink):
           theme_color = dpg.add_theme_color(
             dpg.mvNodeCol_Link,
-            graph.nodes[edge[0]]['color'],
+            node_color_dict[edge[0]],
             category=dpg.mvThemeCat_Nodes)
           self.graph_viewmodel.add_dpg_edge_color(edge, theme_color)
           dpg.bind_item_theme(edge_id, theme_id)
@@ -312,6 +338,23 @@ class GraphView:
   def _cb_menu_copy(self):
     self.graph_viewmodel.copy_selected_node_name(self.dpg_id_editor)
 
+  def _cb_menu_file_open(self):
+    """ Show Dear PyGui's file dialog to select a graph file """
+    if self.dpg_id_file_dialog == -1:
+      with dpg.file_dialog(
+          label='Open Graph File', width=640, height=480, show=False,
+          modal=True, callback=self._cb_file_selected) as self.dpg_id_file_dialog:
+        dpg.add_file_extension('.yaml')
+        dpg.add_file_extension('.dot')
+        dpg.add_file_extension('.*')
+    dpg.show_item(self.dpg_id_file_dialog)
+
+  def _cb_file_selected(self, sender, app_data):
+    """ Load the graph file selected in the file dialog """
+    graph_filename = app_data['file_path_name']
+    self.graph_viewmodel.load_graph(graph_filename)
+    self.update_node_editor()
+
   def _cb_menu_graph_current(self):
     """ Update graph using current ROS status """
     self.graph_viewmodel.load_running_graph()
@@ -319,9 +362,10 @@ class GraphView:
 
   def _cb_menu_font_size(self, sender, app_data, user_data):
     """ Change font size """
-    self.font_size = app_data
-    if self.font_size in self.font_list:
-      self.graph_viewmodel.update_font(self.font_list[self.font_size])
+    self.font['size'] = app_data
+    font = self._get_font(app_data)
+    if font is not None:
+      self.graph_viewmodel.update_font(font)
 
   def _cb_menu_nodename_full(self):
     """ Display full name """
@@ -362,13 +406,21 @@ class GraphView:
     self.graph_viewmodel.high_light_caret_path(path_name)
 
   def _make_font_table(self, font_path):
-    """Make font table"""
-    with dpg.font_registry():
-      for i in range(8, 40):
-        try:
-          self.font_list[i] = dpg.add_font(font_path, i)
-        except SystemError:
-          logger.error('Failed to load font: %s', font_path)
+    """Make font table. Each size is loaded on demand by _get_font"""
+    self.font['path'] = font_path
+    self.font['registry_id'] = dpg.add_font_registry()
+    self._get_font(self.font['size'])
+
+  def _get_font(self, font_size: int):
+    """Get font for a selected size. Load and cache it at the first use"""
+    if font_size not in self.font['list']:
+      try:
+        self.font['list'][font_size] = dpg.add_font(
+          self.font['path'], font_size, parent=self.font['registry_id'])
+      except SystemError:
+        logger.error('Failed to load font: %s', self.font['path'])
+        return None
+    return self.font['list'][font_size]
 
 
 if __name__ == '__main__':
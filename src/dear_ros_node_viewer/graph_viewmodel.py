@@ -15,6 +15,7 @@
 from __future__ import annotations
 import os
 from enum import Enum
+from functools import lru_cache
 import textwrap
 import json
 import networkx as nx
@@ -27,13 +28,13 @@ logger = LoggerFactory.create(__name__)
 
 class GraphViewModel:
   """Class to bind graph and GUI components"""
-  # Color definitions
-  COLOR_HIGHLIGHT_SELECTED = [0, 0, 64]
-  COLOR_HIGHLIGHT_PUB = [0, 64, 0]
-  COLOR_HIGHLIGHT_SUB = [64, 0, 0]
-  COLOR_HIGHLIGHT_CARET_PATH = [0, 96, 0]
-  COLOR_HIGHLIGHT_DEF = [64, 64, 64]
-  COLOR_HIGHLIGHT_EDGE = [196, 196, 196]
+  # Color definitions (tuples so the palette stays immutable)
+  COLOR_HIGHLIGHT_SELECTED = (0, 0, 64)
+  COLOR_HIGHLIGHT_PUB = (0, 64, 0)
+  COLOR_HIGHLIGHT_SUB = (64, 0, 0)
+  COLOR_HIGHLIGHT_CARET_PATH = (0, 96, 0)
+  COLOR_HIGHLIGHT_DEF = (64, 64, 64)
+  COLOR_HIGHLIGHT_EDGE = (196, 196, 196)
 
   class OmitType(Enum):
     """Name omission type"""
@@ -136,17 +137,18 @@ class GraphViewModel:
   def high_light_node(self, dpg_id_node):
     """ High light the selected node and connected nodes """
     graph = self.get_graph()
-    selected_node_name = [k for k, v in self.dpg_bind['node_id'].items() if v == dpg_id_node][0]
+    selected_node_name = next(
+      k for k, v in self.dpg_bind['node_id'].items() if v == dpg_id_node)
     is_re_clicked = self.node_selected_dict[selected_node_name]
     for node_name, _ in self.node_selected_dict.items():
-      publishing_edge_list = [e for e in graph.edges if node_name in e[0]]
-      publishing_edge_subscribing_node_name_list = \
-        [e[1] for e in graph.edges if e[0] == node_name]
-      subscribing_edge_list = [e for e in graph.edges if node_name in e[1]]
-      subscribing_edge_publishing_node_name_list = \
-        [e[0] for e in graph.edges if e[1] == node_name]
       if self.node_selected_dict[node_name]:
         # Disable highlight for all the other nodes#
+        publishing_edge_list = [e for e in graph.edges if node_name in e[0]]
+        publishing_edge_subscribing_node_name_list = \
+          [e[1] for e in graph.edges if e[0] == node_name]
+        subscribing_edge_list = [e for e in graph.edges if node_name in e[1]]
+        subscribing_edge_publishing_node_name_list = \
+          [e[0] for e in graph.edges if e[1] == node_name]
         self.node_selected_dict[node_name] = False
         dpg.set_value(
           self.dpg_bind['node_color'][node_name],
@@ -239,12 +241,16 @@ class GraphViewModel:
     pos_dict = {}
     for node_name, node_id in self.dpg_bind['node_id'].items():
       pos = dpg.get_item_pos(node_id)
-      pos = (pos[0] / self.graph_size[0], pos[1] / self.graph_size[1])
+      # 5 digits of a normalized position are well below one pixel,
+      # and rounding keeps layout.json small
+      pos = (round(pos[0] / self.graph_size[0], 5), round(pos[1] / self.graph_size[1], 5))
       pos_dict[node_name] = pos
 
     filename = self.graph_manager.dir + '/layout.json'
+    # Serialize in memory first so the file is written in one call
+    layout_str = json.dumps(pos_dict, ensure_ascii=True, indent=4)
     with open(filename, encoding='UTF-8', mode='w') as f_layout:
-      json.dump(pos_dict, f_layout, ensure_ascii=True, indent=4)
+      f_layout.write(layout_str)
 
   def update_font(self, font):
     """ Update font used in all nodes according to current font size """
@@ -264,10 +270,16 @@ class GraphViewModel:
 
   def omit_name(self, name: str, omit_type: OmitType) -> str:
     """ replace an original name to a name to be displayed """
+    return self._omit_name_cached(name, omit_type)
+
+  @staticmethod
+  @lru_cache(maxsize=8192)
+  def _omit_name_cached(name: str, omit_type: OmitType) -> str:
+    """Cached body of omit_name. The same names are re-wrapped on every menu action"""
     display_name = name.strip('"')
-    if omit_type == self.OmitType.FULL:
-      display_name = textwrap.fill(display_name, 60)
-    elif omit_type == self.OmitType.FIRST_LAST:
+    if omit_type == GraphViewModel.OmitType.FULL:
+      max_chars = 60
+    elif omit_type == GraphViewModel.OmitType.FIRST_LAST:
       display_name = display_name.split('/')
       if '' in display_name:
         display_name.remove('')
@@ -275,27 +287,28 @@ class GraphViewModel:
         display_name = '/' + display_name[0] + '/' + display_name[-1]
       else:
         display_name = '/' + display_name[0]
-      display_name = textwrap.fill(display_name, 50)
+      max_chars = 50
     else:
       display_name = display_name.split('/')
       display_name = '/' + display_name[-1]
-      display_name = textwrap.fill(display_name, 40)
+      max_chars = 40
+
+    # textwrap is surprisingly costly, so call it only when wrapping can happen
+    if len(display_name) > max_chars:
+      display_name = textwrap.fill(display_name, max_chars)
 
     return display_name
 
   def copy_selected_node_name(self, dpg_id_nodeeditor):
     """Copy selected node names to clipboard"""
-    def get_key(dic, val):
-      for key, value in dic.items():
-        if val == value:
-          return key
-      return None
-
     copied_str = ''
     selected_nodes = dpg.get_selected_nodes(dpg_id_nodeeditor)
     selected_links = dpg.get_selected_links(dpg_id_nodeeditor)
+    # Build the id -> name mapping once instead of scanning it per selected node
+    node_name_dict = {node_id: node_name
+              for node_name, node_id in self.dpg_bind['node_id'].items()}
     if len(selected_nodes) == 1:
-      copied_str = get_key(self.dpg_bind['node_id'], selected_nodes[0])
+      copied_str = node_name_dict[selected_nodes[0]]
       copied_str = copied_str.strip('"')
       print(copied_str)
     elif len(selected_links) == 1:
@@ -304,7 +317,7 @@ class GraphViewModel:
       print(copied_str)
     elif len(selected_nodes) > 1:
       for node_id in selected_nodes:
-        node_name = get_key(self.dpg_bind['node_id'], node_id)
+        node_name = node_name_dict[node_id]
         node_name = node_name.strip('"')
         copied_str += '"' + node_name + '",\n'
         print(node_name)
@@ -22,7 +22,6 @@ Reference: /opt/ros/galactic/lib/python3.8/site-packages/rqt_graph/rosgraph2_imp
 import threading
 import time
 import networkx as nx
-import matplotlib.pyplot as plt
 from .logger_factory import LoggerFactory
 
 # Note: Use try-except to avoid error at pytest in GitHub Actions (todo)
@@ -110,6 +109,7 @@ class Ros2Networkx():
 
 def main():
   """test code"""
+  import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
   node_name = 'Ros2Networkx'
   ros2networkx = Ros2Networkx(node_name=node_name)
   graph = ros2networkx.get_graph()